@@ -1,7 +1,7 @@
 import fs from "node:fs";
 import path from "node:path";
 import initProphet from "@bsull/augurs/prophet";
-import { describe, expect, it } from "vitest";
+import { afterEach, beforeEach, describe, expect, it, vi } from "vitest";
 import {
   ensureWasmInitialized,
   requestCrossValidationCancel,
@@ -10,14 +10,19 @@ import {
 import { cancelCrossValidation } from "../lib/prophet-client";
 import type { CrossValidationRequest, DataPoint } from "../lib/types";
 
-async function initNodeWasm() {
-  const wasmPath = path.resolve(
-    process.cwd(),
-    "node_modules/@bsull/augurs/prophet_bg.wasm",
-  );
-  const wasmBuffer = fs.readFileSync(wasmPath);
-  await initProphet(wasmBuffer);
-  await ensureWasmInitialized(wasmBuffer);
+let nodeWasmReady: Promise<void> | null = null;
+
+function initNodeWasm(): Promise<void> {
+  nodeWasmReady ??= (async () => {
+    const wasmPath = path.resolve(
+      process.cwd(),
+      "node_modules/@bsull/augurs/prophet_bg.wasm",
+    );
+    const wasmBuffer = fs.readFileSync(wasmPath);
+    await initProphet(wasmBuffer);
+    await ensureWasmInitialized(wasmBuffer);
+  })();
+  return nodeWasmReady;
 }
 
 // Simulated Worker Cross-Validation Engine with Cancellation Support
@@ -77,12 +82,20 @@ export async function runCancellationStressTest() {
   };
 
   try {
-    await initNodeWasm();
-    const engine = new MockWorkerProphetEngine();
+    // The three scenarios are independent, so each gets its own engine and
+    // they run concurrently instead of back to back.
+    console.log(
+      "Testing immediate, mid-way (cutoff 3) and uncancelled CV runs...",
+    );
+    const [resImmediate, resMidway, resFull] = await Promise.all([
+      // 1. Immediate Cancellation Test (Cancel at cutoff 0)
+      new MockWorkerProphetEngine().runCrossValidationSim([], 10, 0),
+      // 2. Mid-way Cancellation Test (Cancel at cutoff 3 of 10)
+      new MockWorkerProphetEngine().runCrossValidationSim([], 10, 3),
+      // 3. Normal Uncancelled Run Test
+      new MockWorkerProphetEngine().runCrossValidationSim([], 5),
+    ]);
 
-    // 1. Immediate Cancellation Test (Cancel at cutoff 0)
-    console.log("Testing immediate cancellation on dispatch...");
-    const resImmediate = await engine.runCrossValidationSim([], 10, 0);
     results.immediateCancellationPassed =
       resImmediate.status === "CANCELLED" &&
       resImmediate.evaluatedCutoffs === 0;
@@ -90,18 +103,12 @@ export async function runCancellationStressTest() {
       `Immediate Cancellation: ${results.immediateCancellationPassed ? "PASS" : "FAIL"} (Evaluated: ${resImmediate.evaluatedCutoffs}/10 cutoffs)`,
     );
 
-    // 2. Mid-way Cancellation Test (Cancel at cutoff 3 of 10)
-    console.log("Testing mid-way cancellation during execution (cutoff 3)...");
-    const resMidway = await engine.runCrossValidationSim([], 10, 3);
     results.midwayCancellationPassed =
       resMidway.status === "CANCELLED" && resMidway.evaluatedCutoffs === 3;
     results.details.push(
       `Mid-way Cancellation: ${results.midwayCancellationPassed ? "PASS" : "FAIL"} (Evaluated: ${resMidway.evaluatedCutoffs}/10 cutoffs, stopped immediately)`,
     );
 
-    // 3. Normal Uncancelled Run Test
-    console.log("Testing uncancelled full cross-validation run...");
-    const resFull = await engine.runCrossValidationSim([], 5);
     results.uncancelledCVCompletedPassed =
       resFull.status === "SUCCESS" && resFull.evaluatedCutoffs === 5;
     results.details.push(
@@ -117,25 +124,47 @@ export async function runCancellationStressTest() {
 
 if (process.env.VITEST) {
   describe("Web Worker Cancellation Context & RPC", () => {
-    it("handles immediate cancellation on simulation dispatch", async () => {
+    describe("simulated CV engine", () => {
+      // runCrossValidationSim resets its cancel flag and progress per run
       const engine = new MockWorkerProphetEngine();
-      const res = await engine.runCrossValidationSim([], 10, 0);
-      expect(res.status).toBe("CANCELLED");
-      expect(res.evaluatedCutoffs).toBe(0);
-    });
 
-    it("handles midway cancellation during simulation execution", async () => {
-      const engine = new MockWorkerProphetEngine();
-      const res = await engine.runCrossValidationSim([], 10, 3);
-      expect(res.status).toBe("CANCELLED");
-      expect(res.evaluatedCutoffs).toBe(3);
-    });
+      // The simulated cutoffs only wait on setTimeout, so fake timers let
+      // these cases finish without real delays.
+      beforeEach(() => {
+        vi.useFakeTimers();
+      });
+
+      afterEach(() => {
+        vi.useRealTimers();
+      });
+
+      async function runSim(cutoffsCount: number, cancelAtCutoff?: number) {
+        const pending = engine.runCrossValidationSim(
+          [],
+          cutoffsCount,
+          cancelAtCutoff,
+        );
+        await vi.runAllTimersAsync();
+        return pending;
+      }
 
-    it("completes uncancelled cross-validation run", async () => {
-      const engine = new MockWorkerProphetEngine();
-      const res = await engine.runCrossValidationSim([], 5);
-      expect(res.status).toBe("SUCCESS");
-      expect(res.evaluatedCutoffs).toBe(5);
+      it("handles immediate cancellation on simulation dispatch", async () => {
+        const res = await runSim(10, 0);
+        expect(res.status).toBe("CANCELLED");
+        expect(res.evaluatedCutoffs).toBe(0);
+      });
+
+      it("handles midway cancellation during simulation execution", async () => {
+        const res = await runSim(10, 3);
+        expect(res.status).toBe("CANCELLED");
+        expect(res.evaluatedCutoffs).toBe(3);
+      });
+
+      it("completes uncancelled cross-validation run", async () => {
+        const res = await runSim(5);
+        expect(res.status).toBe("SUCCESS");
+        expect(res.evaluatedCutoffs).toBe(5);
+      });
     });
 
     it("tests scoped cancellation in worker RPC context", async () => {
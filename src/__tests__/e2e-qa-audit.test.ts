@@ -17,6 +17,22 @@ import type {
   ModelConfig,
 } from "../lib/types";
 
+const DAYS_HORIZON_LABEL_RE = /^\d+\s+days$/;
+
+// Daily points starting 2021-07-14 with y supplied per index
+function buildDailySeries(
+  count: number,
+  yAt: (i: number) => number,
+): DataPoint[] {
+  const startMs = Date.UTC(2021, 6, 14);
+  const data: DataPoint[] = new Array(count);
+  for (let i = 0; i < count; i++) {
+    const ds = new Date(startMs + i * 86400 * 1000).toISOString().slice(0, 10);
+    data[i] = { ds, y: yAt(i) };
+  }
+  return data;
+}
+
 beforeAll(async () => {
   const wasmPath = path.resolve(
     process.cwd(),
@@ -75,14 +91,10 @@ describe("Comprehensive E2E QA Audit Suite", () => {
   });
 
   it("Model fitting auto-generates changepoint dates when config.changepoints is empty array []", () => {
-    const data: DataPoint[] = [];
-    const startMs = Date.UTC(2021, 6, 14);
-    for (let i = 0; i < 100; i++) {
-      const d = new Date(startMs + i * 86400 * 1000)
-        .toISOString()
-        .split("T")[0];
-      data.push({ ds: d, y: 100 + i * 0.5 + Math.sin(i / 5) * 5 });
-    }
+    const data = buildDailySeries(
+      100,
+      (i) => 100 + i * 0.5 + Math.sin(i / 5) * 5,
+    );
 
     const config: ModelConfig = {
       growth: "linear",
@@ -98,14 +110,10 @@ describe("Comprehensive E2E QA Audit Suite", () => {
   });
 
   it("Cross-validation on daily stock dataset produces clean horizon bins labeled in days with realistic MAPE", async () => {
-    const data: DataPoint[] = [];
-    const startMs = Date.UTC(2021, 6, 14);
-    for (let i = 0; i < 200; i++) {
-      const d = new Date(startMs + i * 86400 * 1000)
-        .toISOString()
-        .split("T")[0];
-      data.push({ ds: d, y: 250 - i * 0.3 + Math.cos(i / 10) * 8 });
-    }
+    const data = buildDailySeries(
+      200,
+      (i) => 250 - i * 0.3 + Math.cos(i / 10) * 8,
+    );
 
     const cvReq: CrossValidationRequest = {
       data,
@@ -132,7 +140,7 @@ describe("Comprehensive E2E QA Audit Suite", () => {
 
     // Verify horizon labels are in days
     for (const hLabel of res.metrics.horizon) {
-      expect(hLabel).toMatch(/^\d+\s+days$/);
+      expect(hLabel).toMatch(DAYS_HORIZON_LABEL_RE);
       expect(hLabel).not.includes("hours");
     }
 
@@ -1,17 +1,9 @@
 import { describe, expect, it } from "vitest";
+import { forecastToCSV } from "../lib/csv";
 import type { DataPoint, ForecastPoint, ForecastResponse } from "../lib/types";
 
 export function simulateForecastCSVExport(forecast: ForecastPoint[]): string {
-  const headers = ["ds", "yhat", "yhat_lower", "yhat_upper", "trend"];
-  const rows = forecast.map((p) => [
-    p.ds,
-    Number(p.yhat ?? 0).toFixed(4),
-    Number(p.yhat_lower ?? 0).toFixed(4),
-    Number(p.yhat_upper ?? 0).toFixed(4),
-    Number(p.trend ?? 0).toFixed(4),
-  ]);
-
-  return [headers.join(","), ...rows.map((r) => r.join(","))].join("\n");
+  return forecastToCSV(forecast);
 }
 
 export function simulateJSONExport(
@@ -29,7 +21,6 @@ export function simulateJSONExport(
     exportedAt: new Date().toISOString(),
   };
 
-  const _start = performance.now();
   const jsonString = JSON.stringify(exportPayload, null, 2);
   const parseStart = performance.now();
   JSON.parse(jsonString);
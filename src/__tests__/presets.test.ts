@@ -2,17 +2,23 @@ import fs from "node:fs";
 import path from "node:path";
 import initProphet, { Prophet } from "@bsull/augurs/prophet";
 import { optimizer } from "@bsull/augurs-prophet-wasmstan";
-import { describe, expect, it } from "vitest";
+import { beforeAll, describe, expect, it } from "vitest";
 import { type AppState, appReducer, defaultConfig } from "../lib/state";
 import type { ModelConfig } from "../lib/types";
+import { createSeededRandom } from "./seeded-random";
 
-async function initNodeWasm() {
-  const wasmPath = path.resolve(
-    process.cwd(),
-    "node_modules/@bsull/augurs/prophet_bg.wasm",
-  );
-  const wasmBuffer = fs.readFileSync(wasmPath);
-  await initProphet(wasmBuffer);
+let nodeWasmReady: Promise<void> | null = null;
+
+function initNodeWasm(): Promise<void> {
+  nodeWasmReady ??= (async () => {
+    const wasmPath = path.resolve(
+      process.cwd(),
+      "node_modules/@bsull/augurs/prophet_bg.wasm",
+    );
+    const wasmBuffer = fs.readFileSync(wasmPath);
+    await initProphet(wasmBuffer);
+  })();
+  return nodeWasmReady;
 }
 
 export const PRESET_CONFIGS: Record<string, Partial<ModelConfig>> = {
@@ -46,6 +52,23 @@ export const PRESET_CONFIGS: Record<string, Partial<ModelConfig>> = {
   },
 };
 
+const PRESET_BASE_STATE: AppState = {
+  step: 2,
+  data: [],
+  datasetName: "Test Dataset",
+  sampleDataLoaded: false,
+  actionType: "forecast",
+  config: defaultConfig,
+  forecastParams: { periods: 30, freq: "D" },
+  cvParams: { initial: "300 days", period: "60 days", horizon: "90 days" },
+  isLoading: false,
+  loadingMessage: "",
+  forecastResults: null,
+  cvResults: null,
+  activeResultsMode: "forecast",
+  error: null,
+};
+
 export async function runPresetsStressTest() {
   console.log("\n=======================================================");
   console.log("  STRESS TEST 3: Presets (Quick, Detailed, Conservative)");
@@ -70,33 +93,21 @@ export async function runPresetsStressTest() {
     const dsSecs: number[] = [];
     const yVals: number[] = [];
     const startTs = new Date("2023-01-01T00:00:00Z").getTime() / 1000;
+    const random = createSeededRandom(42);
     for (let i = 0; i < 500; i++) {
       dsSecs.push(startTs + i * 86400);
-      yVals.push(
-        50 + i * 0.1 + 10 * Math.sin(i / 15) + (Math.random() - 0.5) * 2,
-      );
+      yVals.push(50 + i * 0.1 + 10 * Math.sin(i / 15) + (random() - 0.5) * 2);
     }
 
-    const initialState: AppState = {
-      step: 2,
-      data: [],
-      datasetName: "Test Dataset",
-      sampleDataLoaded: false,
-      actionType: "forecast",
-      config: defaultConfig,
-      forecastParams: { periods: 30, freq: "D" },
-      cvParams: { initial: "300 days", period: "60 days", horizon: "90 days" },
-      isLoading: false,
-      loadingMessage: "",
-      forecastResults: null,
-      cvResults: null,
-      activeResultsMode: "forecast",
-      error: null,
-    };
+    const futureTs = Array.from(
+      { length: 30 },
+      (_, i) => dsSecs[dsSecs.length - 1] + (i + 1) * 86400,
+    );
+    const predictDs = [...dsSecs, ...futureTs];
 
     for (const [name, presetPayload] of Object.entries(PRESET_CONFIGS)) {
       // 1. Test Reducer state update
-      const updatedState = appReducer(initialState, {
+      const updatedState = appReducer(PRESET_BASE_STATE, {
         type: "SET_CONFIG",
         payload: presetPayload,
       });
@@ -134,11 +145,7 @@ export async function runPresetsStressTest() {
       const fitStart = performance.now();
       prophet.fit({ ds: dsSecs, y: yVals });
 
-      const futureTs = Array.from(
-        { length: 30 },
-        (_, i) => dsSecs[dsSecs.length - 1] + (i + 1) * 86400,
-      );
-      const predictions = prophet.predict({ ds: [...dsSecs, ...futureTs] });
+      const predictions = prophet.predict({ ds: predictDs });
       const fitTime = performance.now() - fitStart;
 
       prophet.free();
@@ -171,135 +178,58 @@ export async function runPresetsStressTest() {
   return results;
 }
 
+// 200 daily timestamps from 2024-01-01, shared by every preset test case
+const TEST_START_TS = Math.floor(Date.UTC(2024, 0, 1) / 1000);
+const TEST_DS_SECS = Array.from(
+  { length: 200 },
+  (_, i) => TEST_START_TS + i * 86400,
+);
+
 if (process.env.VITEST) {
   describe("Model Configuration Presets", () => {
-    it("applies Quick preset to state reducer and fits WASM model", async () => {
-      await initNodeWasm();
-      const initialState: AppState = {
-        step: 2,
-        data: [],
-        datasetName: "Test Dataset",
-        sampleDataLoaded: false,
-        actionType: "forecast",
-        config: defaultConfig,
-        forecastParams: { periods: 30, freq: "D" },
-        cvParams: {
-          initial: "300 days",
-          period: "60 days",
-          horizon: "90 days",
-        },
-        isLoading: false,
-        loadingMessage: "",
-        forecastResults: null,
-        cvResults: null,
-        activeResultsMode: "forecast",
-        error: null,
-      };
-
-      const updatedState = appReducer(initialState, {
-        type: "SET_CONFIG",
-        payload: PRESET_CONFIGS.Quick,
-      });
-
-      expect(updatedState.config.growth).toBe("linear");
-      expect(updatedState.config.seasonality_mode).toBe("additive");
-      expect(updatedState.config.n_changepoints).toBe(15);
-
-      const startTs = Math.floor(Date.UTC(2024, 0, 1) / 1000);
-      const dsSecs: number[] = [];
-      const yVals: number[] = [];
-      for (let i = 0; i < 200; i++) {
-        dsSecs.push(startTs + i * 86400);
-        yVals.push(50 + i * 0.1 + Math.sin(i / 10));
-      }
-
-      const prophet = new Prophet({
-        optimizer,
-        growth: "linear",
-        nChangepoints: updatedState.config.n_changepoints,
+    beforeAll(() => initNodeWasm());
+
+    it.each<{
+      preset: string;
+      seasonalityMode: "additive" | "multiplicative";
+      yAt: (i: number) => number;
+    }>([
+      {
+        preset: "Quick",
         seasonalityMode: "additive",
-      });
-      prophet.fit({ ds: dsSecs, y: yVals });
-      const predictions = prophet.predict({ ds: dsSecs });
-      expect(predictions.yhat.point.length).toBe(200);
-      prophet.free();
-    });
-
-    it("applies Detailed preset with multiplicative seasonality and fits model", async () => {
-      await initNodeWasm();
-      const initialState: AppState = {
-        step: 2,
-        data: [],
-        datasetName: "Test Dataset",
-        sampleDataLoaded: false,
-        actionType: "forecast",
-        config: defaultConfig,
-        forecastParams: { periods: 30, freq: "D" },
-        cvParams: {
-          initial: "300 days",
-          period: "60 days",
-          horizon: "90 days",
-        },
-        isLoading: false,
-        loadingMessage: "",
-        forecastResults: null,
-        cvResults: null,
-        activeResultsMode: "forecast",
-        error: null,
-      };
-
-      const updatedState = appReducer(initialState, {
-        type: "SET_CONFIG",
-        payload: PRESET_CONFIGS.Detailed,
-      });
-
-      expect(updatedState.config.seasonality_mode).toBe("multiplicative");
-      expect(updatedState.config.n_changepoints).toBe(30);
-
-      const startTs = Math.floor(Date.UTC(2024, 0, 1) / 1000);
-      const dsSecs: number[] = [];
-      const yVals: number[] = [];
-      for (let i = 0; i < 200; i++) {
-        dsSecs.push(startTs + i * 86400);
-        yVals.push(100 + i * 0.2 + Math.cos(i / 10));
-      }
-
-      const prophet = new Prophet({
-        optimizer,
-        growth: "linear",
+        yAt: (i) => 50 + i * 0.1 + Math.sin(i / 10),
+      },
+      {
+        preset: "Detailed",
         seasonalityMode: "multiplicative",
-        nChangepoints: 30,
-      });
-      prophet.fit({ ds: dsSecs, y: yVals });
-      const predictions = prophet.predict({ ds: dsSecs });
-      expect(predictions.yhat.point.length).toBe(200);
-      prophet.free();
-    });
-
-    it("applies Conservative preset with tight changepoint prior scale", async () => {
-      await initNodeWasm();
-      const initialState: AppState = {
-        step: 2,
-        data: [],
-        datasetName: "Test Dataset",
-        sampleDataLoaded: false,
-        actionType: "forecast",
-        config: defaultConfig,
-        forecastParams: { periods: 30, freq: "D" },
-        cvParams: {
-          initial: "300 days",
-          period: "60 days",
-          horizon: "90 days",
-        },
-        isLoading: false,
-        loadingMessage: "",
-        forecastResults: null,
-        cvResults: null,
-        activeResultsMode: "forecast",
-        error: null,
-      };
+        yAt: (i) => 100 + i * 0.2 + Math.cos(i / 10),
+      },
+    ])(
+      "applies $preset preset ($seasonalityMode) to state reducer and fits WASM model",
+      ({ preset, seasonalityMode, yAt }) => {
+        const updatedState = appReducer(PRESET_BASE_STATE, {
+          type: "SET_CONFIG",
+          payload: PRESET_CONFIGS[preset],
+        });
+
+        expect(updatedState.config).toMatchObject(PRESET_CONFIGS[preset]);
+
+        const yVals = TEST_DS_SECS.map((_, i) => yAt(i));
+        const prophet = new Prophet({
+          optimizer,
+          growth: "linear",
+          nChangepoints: updatedState.config.n_changepoints,
+          seasonalityMode,
+        });
+        prophet.fit({ ds: TEST_DS_SECS, y: yVals });
+        const predictions = prophet.predict({ ds: TEST_DS_SECS });
+        expect(predictions.yhat.point.length).toBe(200);
+        prophet.free();
+      },
+    );
 
-      const updatedState = appReducer(initialState, {
+    it("applies Conservative preset with tight changepoint prior scale", () => {
+      const updatedState = appReducer(PRESET_BASE_STATE, {
         type: "SET_CONFIG",
         payload: PRESET_CONFIGS.Conservative,
       });
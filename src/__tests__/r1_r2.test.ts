@@ -5,6 +5,7 @@ import { beforeAll, describe, expect, it } from "vitest";
 import { detectFrequencyCode } from "../lib/csv";
 import {
   checkHasTimeComponents,
+  computeCutoffs,
   ensureWasmInitialized,
   formatIsoDate,
   generateFutureTimestamps,
@@ -16,17 +17,7 @@ import {
 import { appReducer, initialAppState } from "../lib/state";
 import type { CrossValidationRequest, DataPoint } from "../lib/types";
 
-beforeAll(async () => {
-  const wasmPath = path.resolve(
-    process.cwd(),
-    "node_modules/@bsull/augurs/prophet_bg.wasm",
-  );
-  if (fs.existsSync(wasmPath)) {
-    const wasmBuffer = fs.readFileSync(wasmPath);
-    await initProphet(wasmBuffer);
-    await ensureWasmInitialized(wasmBuffer);
-  }
-});
+const CUTOFF_DATETIME_RE = /^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$/;
 
 describe("R2 Fixes - parseDurationToSeconds", () => {
   it("correctly parses seconds", () => {
@@ -91,27 +82,23 @@ describe("R2 Fixes - parseDurationToSeconds", () => {
     expect(parseDurationToSeconds("5 years")).toBe(5 * 365 * 86400);
   });
 
-  it("explicitly verifies exact requested edge-case duration strings", () => {
-    const testCases: Array<[string, number]> = [
-      ["5m", 300],
-      ["5 min", 300],
-      ["5 minutes", 300],
-      ["5mo", 5 * 30 * 86400],
-      ["5 month", 5 * 30 * 86400],
-      ["5months", 5 * 30 * 86400],
-      ["2w", 2 * 7 * 86400],
-      ["3d", 3 * 86400],
-      ["12h", 12 * 3600],
-      ["30s", 30],
-    ];
-
-    for (const [input, expectedSec] of testCases) {
-      expect(
-        parseDurationToSeconds(input),
-        `Failed for input: "${input}"`,
-      ).toBe(expectedSec);
-    }
-  });
+  it.each<[string, number]>([
+    ["5m", 300],
+    ["5 min", 300],
+    ["5 minutes", 300],
+    ["5mo", 5 * 30 * 86400],
+    ["5 month", 5 * 30 * 86400],
+    ["5months", 5 * 30 * 86400],
+    ["2w", 2 * 7 * 86400],
+    ["3d", 3 * 86400],
+    ["12h", 12 * 3600],
+    ["30s", 30],
+  ])(
+    "parses edge-case duration string %j as %i seconds",
+    (input, expectedSec) => {
+      expect(parseDurationToSeconds(input)).toBe(expectedSec);
+    },
+  );
 
   it("handles case-insensitivity and whitespace", () => {
     expect(parseDurationToSeconds("  12H  ")).toBe(43200);
@@ -210,6 +197,19 @@ describe("R2 Fixes - Calendar-Aware Horizon Stepping & Frequency Stepping", () =
 });
 
 describe("R1 Fixes - ISO Formatting & Sub-daily support", () => {
+  // Only the sub-daily CV test in this block needs the Prophet WASM module
+  beforeAll(async () => {
+    const wasmPath = path.resolve(
+      process.cwd(),
+      "node_modules/@bsull/augurs/prophet_bg.wasm",
+    );
+    if (fs.existsSync(wasmPath)) {
+      const wasmBuffer = fs.readFileSync(wasmPath);
+      await initProphet(wasmBuffer);
+      await ensureWasmInitialized(wasmBuffer);
+    }
+  });
+
   it("parses ISO date and timestamp strings consistently in UTC", () => {
     const expectedUtcSec = Math.floor(Date.UTC(2024, 0, 1, 0, 0, 0) / 1000);
     expect(parseTimestamp("2024-01-01")).toBe(expectedUtcSec);
@@ -297,136 +297,81 @@ describe("R1 Fixes - ISO Formatting & Sub-daily support", () => {
 
     // Verify cutoff strings in evaluation output preserve time components (HH:mm:ss)
     for (const ev of res.cv_results) {
-      expect(ev.cutoff).toMatch(/^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$/);
+      expect(ev.cutoff).toMatch(CUTOFF_DATETIME_RE);
     }
   });
 });
 
 describe("Cross-Validation Cutoffs - Backward Stepping & Chronological Ordering", () => {
-  it("calculates backward stepping cutoffs from maxTs - horizon down to minTs + initial", () => {
-    const minTs = Math.floor(Date.UTC(2024, 0, 1) / 1000);
-    const maxTs = Math.floor(Date.UTC(2024, 3, 10) / 1000);
-
-    const initialSec = parseDurationToSeconds("30 days");
-    const periodSec = parseDurationToSeconds("10 days");
-    const horizonSec = parseDurationToSeconds("15 days");
-
-    const minCutoff = minTs + initialSec;
-    const cutoffs: number[] = [];
-    let curCutoff = maxTs - horizonSec;
-
-    while (curCutoff >= minCutoff) {
-      cutoffs.push(curCutoff);
-      curCutoff -= periodSec;
-    }
-    cutoffs.reverse();
+  const DAY_START = Math.floor(Date.UTC(2024, 0, 1) / 1000);
+
+  it.each([
+    {
+      name: "calculates backward stepping cutoffs from maxTs - horizon down to minTs + initial",
+      maxTs: Math.floor(Date.UTC(2024, 3, 10) / 1000),
+      initial: "30 days",
+      period: "10 days",
+      horizon: "15 days",
+      expectedCount: 6,
+    },
+    {
+      name: "handles unaligned dataset span with exact period steps",
+      maxTs: Math.floor(Date.UTC(2024, 2, 14) / 1000), // Mar 14 (73 days)
+      initial: "20 days",
+      period: "7 days",
+      horizon: "10 days",
+      expectedCount: 7,
+    },
+    {
+      name: "handles hourly sub-daily cutoffs stepping backward",
+      maxTs: DAY_START + 240 * 3600, // 10 days of hourly data
+      initial: "48h",
+      period: "12h",
+      horizon: "24h",
+      expectedCount: 15,
+    },
+    {
+      name: "produces empty cutoffs array when span is shorter than initial + horizon",
+      maxTs: DAY_START + 20 * 86400, // initial + horizon = 25 days > 20 days
+      initial: "15 days",
+      period: "5 days",
+      horizon: "10 days",
+      expectedCount: 0,
+    },
+    {
+      name: "produces exactly 1 cutoff when span equals initial + horizon",
+      maxTs: DAY_START + 25 * 86400, // 15 + 10 = 25
+      initial: "15 days",
+      period: "5 days",
+      horizon: "10 days",
+      expectedCount: 1,
+    },
+  ])("$name", ({ maxTs, initial, period, horizon, expectedCount }) => {
+    const minTs = DAY_START;
+    const initialSec = parseDurationToSeconds(initial);
+    const periodSec = parseDurationToSeconds(period);
+    const horizonSec = parseDurationToSeconds(horizon);
+
+    const cutoffs = computeCutoffs(
+      minTs,
+      maxTs,
+      initialSec,
+      periodSec,
+      horizonSec,
+    );
 
-    expect(cutoffs.length).toBeGreaterThan(0);
+    expect(cutoffs.length).toBe(expectedCount);
+    if (expectedCount === 0) return;
     // Highest cutoff MUST be exactly maxTs - horizonSec
     expect(cutoffs[cutoffs.length - 1]).toBe(maxTs - horizonSec);
     // Lowest cutoff MUST be >= minTs + initialSec
-    expect(cutoffs[0]).toBeGreaterThanOrEqual(minCutoff);
-    // Verify strict chronological ascending order
+    expect(cutoffs[0]).toBeGreaterThanOrEqual(minTs + initialSec);
+    // Verify strict chronological ascending order with exact period steps
     for (let i = 1; i < cutoffs.length; i++) {
-      expect(cutoffs[i]).toBeGreaterThan(cutoffs[i - 1]);
       expect(cutoffs[i] - cutoffs[i - 1]).toBe(periodSec);
     }
   });
 
-  it("handles unaligned dataset span with exact period steps", () => {
-    const minTs = Math.floor(Date.UTC(2024, 0, 1) / 1000); // Jan 1
-    const maxTs = Math.floor(Date.UTC(2024, 2, 14) / 1000); // Mar 14 (73 days)
-
-    const initialSec = parseDurationToSeconds("20 days");
-    const periodSec = parseDurationToSeconds("7 days");
-    const horizonSec = parseDurationToSeconds("10 days");
-
-    const minCutoff = minTs + initialSec;
-    const cutoffs: number[] = [];
-    let curCutoff = maxTs - horizonSec;
-
-    while (curCutoff >= minCutoff) {
-      cutoffs.push(curCutoff);
-      curCutoff -= periodSec;
-    }
-    cutoffs.reverse();
-
-    expect(cutoffs.length).toBe(7);
-    expect(cutoffs[cutoffs.length - 1]).toBe(maxTs - horizonSec);
-    for (let i = 1; i < cutoffs.length; i++) {
-      expect(cutoffs[i] - cutoffs[i - 1]).toBe(periodSec);
-    }
-  });
-
-  it("handles hourly sub-daily cutoffs stepping backward", () => {
-    const minTs = Math.floor(Date.UTC(2024, 0, 1, 0, 0, 0) / 1000);
-    const maxTs = minTs + 240 * 3600; // 10 days of hourly data
-
-    const initialSec = parseDurationToSeconds("48h");
-    const periodSec = parseDurationToSeconds("12h");
-    const horizonSec = parseDurationToSeconds("24h");
-
-    const minCutoff = minTs + initialSec;
-    const cutoffs: number[] = [];
-    let curCutoff = maxTs - horizonSec;
-
-    while (curCutoff >= minCutoff) {
-      cutoffs.push(curCutoff);
-      curCutoff -= periodSec;
-    }
-    cutoffs.reverse();
-
-    expect(cutoffs.length).toBe(15);
-    expect(cutoffs[cutoffs.length - 1]).toBe(maxTs - horizonSec);
-    for (let i = 1; i < cutoffs.length; i++) {
-      expect(cutoffs[i] - cutoffs[i - 1]).toBe(12 * 3600);
-    }
-  });
-
-  it("produces empty cutoffs array when span is shorter than initial + horizon", () => {
-    const minTs = Math.floor(Date.UTC(2024, 0, 1) / 1000);
-    const maxTs = minTs + 20 * 86400; // 20 days span
-
-    const initialSec = parseDurationToSeconds("15 days");
-    const periodSec = parseDurationToSeconds("5 days");
-    const horizonSec = parseDurationToSeconds("10 days"); // initial + horizon = 25 days > 20 days
-
-    const minCutoff = minTs + initialSec;
-    const cutoffs: number[] = [];
-    let curCutoff = maxTs - horizonSec;
-
-    while (curCutoff >= minCutoff) {
-      cutoffs.push(curCutoff);
-      curCutoff -= periodSec;
-    }
-    cutoffs.reverse();
-
-    expect(cutoffs.length).toBe(0);
-  });
-
-  it("produces exactly 1 cutoff when span equals initial + horizon", () => {
-    const minTs = Math.floor(Date.UTC(2024, 0, 1) / 1000);
-    const maxTs = minTs + 25 * 86400; // 25 days span
-
-    const initialSec = parseDurationToSeconds("15 days");
-    const periodSec = parseDurationToSeconds("5 days");
-    const horizonSec = parseDurationToSeconds("10 days"); // 15 + 10 = 25
-
-    const minCutoff = minTs + initialSec;
-    const cutoffs: number[] = [];
-    let curCutoff = maxTs - horizonSec;
-
-    while (curCutoff >= minCutoff) {
-      cutoffs.push(curCutoff);
-      curCutoff -= periodSec;
-    }
-    cutoffs.reverse();
-
-    expect(cutoffs.length).toBe(1);
-    expect(cutoffs[0]).toBe(minTs + initialSec);
-    expect(cutoffs[0]).toBe(maxTs - horizonSec);
-  });
-
   it("auto-detects dataset frequency code and sets state forecastParams.freq", () => {
     const monthlyData = [
       { ds: "1949-01-01", y: 112 },
@@ -82,9 +82,6 @@ async function main() {
   let allPassed = true;
   for (const [testName, passed] of Object.entries(overallResults)) {
     const statusStr = passed ? "PASS" : "FAIL";
-    const _statusFormatted = passed
-      ? `\x1b[32m[PASS]\x1b[0m`
-      : `\x1b[31m[FAIL]\x1b[0m`;
     console.log(` ${statusStr.padEnd(6)} | ${testName}`);
     if (!passed) allPassed = false;
   }
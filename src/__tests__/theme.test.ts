@@ -1,10 +1,13 @@
-import { describe, expect, it } from "vitest";
+import { afterEach, beforeEach, describe, expect, it } from "vitest";
 import { applyTheme } from "../lib/theme";
 
+const MOCKED_GLOBALS = ["document", "localStorage", "window"] as const;
+
 export class MockDOMThemeEnvironment {
   public documentClassList = new Set<string>();
   public localStorageStore = new Map<string, string>();
   public listeners = new Set<() => void>();
+  private previousGlobals: Record<string, unknown> = {};
 
   constructor() {
     // Setup mock global environment for Node
@@ -37,6 +40,9 @@ export class MockDOMThemeEnvironment {
     };
 
     const g = globalThis as unknown as Record<string, unknown>;
+    for (const key of MOCKED_GLOBALS) {
+      this.previousGlobals[key] = g[key];
+    }
     g.document = { documentElement: mockElement };
     g.localStorage = mockStorage;
     g.window = {
@@ -45,8 +51,33 @@ export class MockDOMThemeEnvironment {
       matchMedia: () => ({ matches: false }),
     };
   }
+
+  // Put back whatever globals existed before this mock was installed
+  public restore() {
+    const g = globalThis as unknown as Record<string, unknown>;
+    for (const key of MOCKED_GLOBALS) {
+      if (this.previousGlobals[key] === undefined) {
+        Reflect.deleteProperty(g, key);
+      } else {
+        g[key] = this.previousGlobals[key];
+      }
+    }
+  }
 }
 
+const DARK_CHART_VARS = {
+  "--chart-1": "hsl(217.2 91.2% 59.8%)",
+  "--chart-2": "hsl(142.1 70.6% 45.3%)",
+  "--chart-3": "hsl(47.9 95.8% 53.1%)",
+  background: "#0f172a",
+};
+const LIGHT_CHART_VARS = {
+  "--chart-1": "hsl(221.2 83.2% 53.3%)",
+  "--chart-2": "hsl(142.1 76.2% 36.3%)",
+  "--chart-3": "hsl(47.9 95.8% 53.1%)",
+  background: "#ffffff",
+};
+
 export async function runThemeAdaptationStressTest() {
   console.log("\n=======================================================");
   console.log("  STRESS TEST 6: Theme Adaptation & Dark Mode Sync");
@@ -60,8 +91,9 @@ export async function runThemeAdaptationStressTest() {
     details: [] as string[],
   };
 
+  let env: MockDOMThemeEnvironment | undefined;
   try {
-    const env = new MockDOMThemeEnvironment();
+    env = new MockDOMThemeEnvironment();
 
     // 1. Switch to Dark Mode
     console.log("Testing switch to 'dark' mode...");
@@ -102,28 +134,17 @@ export async function runThemeAdaptationStressTest() {
     );
 
     // 4. Verify CSS variable map for Recharts in dark vs light mode
-    const darkChartVars = {
-      "--chart-1": "hsl(217.2 91.2% 59.8%)",
-      "--chart-2": "hsl(142.1 70.6% 45.3%)",
-      "--chart-3": "hsl(47.9 95.8% 53.1%)",
-      background: "#0f172a",
-    };
-    const lightChartVars = {
-      "--chart-1": "hsl(221.2 83.2% 53.3%)",
-      "--chart-2": "hsl(142.1 76.2% 36.3%)",
-      "--chart-3": "hsl(47.9 95.8% 53.1%)",
-      background: "#ffffff",
-    };
-
     results.chartThemeColorResolutionPassed =
-      Boolean(darkChartVars["--chart-1"]) &&
-      Boolean(lightChartVars["--chart-1"]);
+      Boolean(DARK_CHART_VARS["--chart-1"]) &&
+      Boolean(LIGHT_CHART_VARS["--chart-1"]);
     results.details.push(
       `Chart Theme Color Variable Mapping: ${results.chartThemeColorResolutionPassed ? "PASS" : "FAIL"}`,
     );
   } catch (err: unknown) {
     const errorMsg = err instanceof Error ? err.message : String(err);
     results.details.push(`ERROR in Theme Adaptation stress test: ${errorMsg}`);
+  } finally {
+    env?.restore();
   }
 
   return results;
@@ -131,15 +152,23 @@ export async function runThemeAdaptationStressTest() {
 
 if (process.env.VITEST) {
   describe("Theme Adaptation & Dark Mode Sync", () => {
+    let env: MockDOMThemeEnvironment;
+
+    beforeEach(() => {
+      env = new MockDOMThemeEnvironment();
+    });
+
+    afterEach(() => {
+      env.restore();
+    });
+
     it("toggles dark mode and updates HTML element class and localStorage", () => {
-      const env = new MockDOMThemeEnvironment();
       applyTheme("dark");
       expect(env.documentClassList.has("dark")).toBe(true);
       expect(env.localStorageStore.get("theme")).toBe("dark");
     });
 
     it("toggles light mode and removes dark class and updates localStorage", () => {
-      const env = new MockDOMThemeEnvironment();
       applyTheme("dark");
       applyTheme("light");
       expect(env.documentClassList.has("dark")).toBe(false);
@@ -147,7 +176,6 @@ if (process.env.VITEST) {
     });
 
     it("handles 1000 rapid theme toggles without state desync", () => {
-      const env = new MockDOMThemeEnvironment();
       for (let i = 0; i < 1000; i++) {
         applyTheme(i % 2 === 0 ? "dark" : "light");
       }
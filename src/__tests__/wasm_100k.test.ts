@@ -5,19 +5,26 @@ import { optimizer } from "@bsull/augurs-prophet-wasmstan";
 import { describe, expect, it } from "vitest";
 import { parseCSVText } from "../lib/csv";
 import type { DataPoint } from "../lib/types";
+import { createSeededRandom } from "./seeded-random";
 
-// Helper to initialize Prophet WASM in Node environment
-async function initNodeWasm() {
-  const wasmPath = path.resolve(
-    process.cwd(),
-    "node_modules/@bsull/augurs/prophet_bg.wasm",
-  );
-  const wasmBuffer = fs.readFileSync(wasmPath);
-  await initProphet(wasmBuffer);
+let nodeWasmReady: Promise<void> | null = null;
+
+// Helper to initialize Prophet WASM in Node environment (once per module)
+function initNodeWasm(): Promise<void> {
+  nodeWasmReady ??= (async () => {
+    const wasmPath = path.resolve(
+      process.cwd(),
+      "node_modules/@bsull/augurs/prophet_bg.wasm",
+    );
+    const wasmBuffer = fs.readFileSync(wasmPath);
+    await initProphet(wasmBuffer);
+  })();
+  return nodeWasmReady;
 }
 
-export function generateSyntheticData(count: number): DataPoint[] {
+export function generateSyntheticData(count: number, seed = 42): DataPoint[] {
   const points: DataPoint[] = [];
+  const random = createSeededRandom(seed);
   const startTs = new Date("2020-01-01T00:00:00Z").getTime();
   const dayMs = 86400 * 1000;
 
@@ -26,7 +33,7 @@ export function generateSyntheticData(count: number): DataPoint[] {
     // Baseline trend + seasonality + noise
     const trend = 100 + i * 0.05;
     const seasonality = 10 * Math.sin((2 * Math.PI * i) / 365.25);
-    const noise = (Math.random() - 0.5) * 2;
+    const noise = (random() - 0.5) * 2;
     const y = Number((trend + seasonality + noise).toFixed(2));
     points.push({ ds, y });
   }
@@ -183,7 +190,8 @@ if (process.env.VITEST) {
     });
 
     it("parses 100k CSV rows into DataPoints correctly", () => {
-      const csvContent = generateSyntheticCSV(100000);
+      // Only row count and shape are asserted, so a repeated row suffices
+      const csvContent = `ds,y\n${"2020-01-01,100.00\n".repeat(100000)}`;
       const parsed = parseCSVText(csvContent);
       expect(parsed.length).toBe(100000);
       expect(parsed[0].ds).toBe("2020-01-01");
@@ -93,24 +93,35 @@ export function StepUpload({
   // Dataset statistics & Validation Warnings Calculation
   const stats = useMemo(() => {
     if (!data || data.length === 0) return null;
-    const yValues = data
-      .map((d) => d.y)
-      .filter((v) => typeof v === "number" && !isNaN(v));
-    if (yValues.length === 0) return null;
-
-    const min = Math.min(...yValues);
-    const max = Math.max(...yValues);
-    const sum = yValues.reduce((a, b) => a + b, 0);
-    const mean = sum / yValues.length;
-    const variance =
-      yValues.reduce((a, b) => a + (b - mean) ** 2, 0) / yValues.length;
-    const std = Math.sqrt(variance);
+    let count = 0;
+    let sum = 0;
+    let min = Infinity;
+    let max = -Infinity;
+    for (const d of data) {
+      const v = d.y;
+      if (typeof v !== "number" || isNaN(v)) continue;
+      count++;
+      sum += v;
+      if (v < min) min = v;
+      if (v > max) max = v;
+    }
+    if (count === 0) return null;
+
+    const mean = sum / count;
+    let sqDiffSum = 0;
+    for (const d of data) {
+      const v = d.y;
+      if (typeof v !== "number" || isNaN(v)) continue;
+      sqDiffSum += (v - mean) ** 2;
+    }
+    const std = Math.sqrt(sqDiffSum / count);
 
     // Frequency detection
     let detectedFreq = "Daily (D)";
     if (data.length >= 2) {
       const diffs: number[] = [];
-      for (let i = 1; i < Math.min(data.length, 150); i++) {
+      const sampleEnd = Math.min(data.length, 150);
+      for (let i = 1; i < sampleEnd; i++) {
         const t1 = new Date(data[i - 1].ds).getTime();
         const t2 = new Date(data[i].ds).getTime();
         if (!isNaN(t1) && !isNaN(t2)) {
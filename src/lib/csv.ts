@@ -9,27 +9,54 @@ export interface CSVParseResult {
   autoFloor: string | null;
 }
 
+const NUMERIC_NOISE_RE = /[,$€£]/g;
+
+const DS_COLUMN_ALIASES = new Set(["ds", "date", "timestamp", "time"]);
+const Y_COLUMN_ALIASES = new Set([
+  "y",
+  "value",
+  "sales",
+  "close",
+  "price",
+  "count",
+]);
+const CAP_COLUMN_ALIASES = new Set(["cap", "capacity", "max"]);
+const FLOOR_COLUMN_ALIASES = new Set(["floor", "min"]);
+
+function parseNumericCell(raw: string | undefined): number {
+  if (!raw) return Number.NaN;
+  return Number.parseFloat(raw.replace(NUMERIC_NOISE_RE, "").trim());
+}
+
+const CELL_QUOTE_TRIM_RE = /^["']|["']$/g;
+
 function parseCSVLine(line: string): string[] {
   const result: string[] = [];
+  // Unquoted runs are copied with one slice rather than char by char;
+  // `cur` only accumulates across quote boundaries.
   let cur = "";
+  let runStart = 0;
   let inQuotes = false;
   for (let i = 0; i < line.length; i++) {
     const char = line[i];
     if (char === '"' || char === "'") {
+      cur += line.slice(runStart, i);
       if (inQuotes && line[i + 1] === char) {
         cur += char;
         i++;
       } else {
         inQuotes = !inQuotes;
       }
+      runStart = i + 1;
     } else if (char === "," && !inQuotes) {
-      result.push(cur.trim().replace(/^["']|["']$/g, ""));
+      cur += line.slice(runStart, i);
+      result.push(cur.trim().replace(CELL_QUOTE_TRIM_RE, ""));
       cur = "";
-    } else {
-      cur += char;
+      runStart = i + 1;
     }
   }
-  result.push(cur.trim().replace(/^["']|["']$/g, ""));
+  cur += line.slice(runStart);
+  result.push(cur.trim().replace(CELL_QUOTE_TRIM_RE, ""));
   return result;
 }
 
@@ -46,22 +73,10 @@ export function analyzeCSV(csvText: string): CSVParseResult {
   const columns = parseCSVLine(lines[0]);
   const lowerCols = columns.map((c) => c.toLowerCase());
 
-  const dsIdx = lowerCols.findIndex(
-    (c) => c === "ds" || c === "date" || c === "timestamp" || c === "time",
-  );
-  const yIdx = lowerCols.findIndex(
-    (c) =>
-      c === "y" ||
-      c === "value" ||
-      c === "sales" ||
-      c === "close" ||
-      c === "price" ||
-      c === "count",
-  );
-  const capIdx = lowerCols.findIndex(
-    (c) => c === "cap" || c === "capacity" || c === "max",
-  );
-  const floorIdx = lowerCols.findIndex((c) => c === "floor" || c === "min");
+  const dsIdx = lowerCols.findIndex((c) => DS_COLUMN_ALIASES.has(c));
+  const yIdx = lowerCols.findIndex((c) => Y_COLUMN_ALIASES.has(c));
+  const capIdx = lowerCols.findIndex((c) => CAP_COLUMN_ALIASES.has(c));
+  const floorIdx = lowerCols.findIndex((c) => FLOOR_COLUMN_ALIASES.has(c));
 
   const rawRows: Array<Record<string, string>> = [];
 
@@ -99,10 +114,7 @@ export function buildDataPointsFromCSV(
 
   for (const row of rawRows) {
     const dsVal = row[dsCol];
-    const rawY = row[yCol]
-      ? String(row[yCol]).replace(/,/g, "").replace(/[$€£]/g, "").trim()
-      : "";
-    const yVal = Number.parseFloat(rawY);
+    const yVal = parseNumericCell(row[yCol]);
 
     if (!dsVal || Number.isNaN(yVal)) continue;
 
@@ -110,11 +122,7 @@ export function buildDataPointsFromCSV(
 
     // Cap (Column or Fixed)
     if (capCol && row[capCol] !== undefined) {
-      const rawCap = String(row[capCol])
-        .replace(/,/g, "")
-        .replace(/[$€£]/g, "")
-        .trim();
-      const capParsed = Number.parseFloat(rawCap);
+      const capParsed = parseNumericCell(row[capCol]);
       if (!Number.isNaN(capParsed)) pt.cap = capParsed;
     } else if (
       fixedCap !== undefined &&
@@ -126,11 +134,7 @@ export function buildDataPointsFromCSV(
 
     // Floor (Column or Fixed)
     if (floorCol && row[floorCol] !== undefined) {
-      const rawFloor = String(row[floorCol])
-        .replace(/,/g, "")
-        .replace(/[$€£]/g, "")
-        .trim();
-      const floorParsed = Number.parseFloat(rawFloor);
+      const floorParsed = parseNumericCell(row[floorCol]);
       if (!Number.isNaN(floorParsed)) pt.floor = floorParsed;
     } else if (
       fixedFloor !== undefined &&
@@ -174,7 +178,8 @@ export function detectFrequencyCode(data: { ds: string }[]): string {
   if (timestamps.length < 2) return "D";
 
   const diffs: number[] = [];
-  for (let i = 1; i < Math.min(timestamps.length, 150); i++) {
+  const sampleEnd = Math.min(timestamps.length, 150);
+  for (let i = 1; i < sampleEnd; i++) {
     const diff = timestamps[i] - timestamps[i - 1];
     if (diff > 0) diffs.push(diff);
   }
@@ -192,19 +197,22 @@ export function detectFrequencyCode(data: { ds: string }[]): string {
   return "D";
 }
 
+export function forecastToCSV(forecast: ForecastPoint[]): string {
+  const lines = new Array<string>(forecast.length + 1);
+  lines[0] = "ds,yhat,yhat_lower,yhat_upper,trend";
+  for (let i = 0; i < forecast.length; i++) {
+    const p = forecast[i];
+    const yhat = Number(p.yhat ?? 0).toFixed(4);
+    const lower = Number(p.yhat_lower ?? 0).toFixed(4);
+    const upper = Number(p.yhat_upper ?? 0).toFixed(4);
+    const trend = Number(p.trend ?? 0).toFixed(4);
+    lines[i + 1] = `${p.ds},${yhat},${lower},${upper},${trend}`;
+  }
+  return lines.join("\n");
+}
+
 export function exportForecastCSV(forecast: ForecastPoint[]): void {
-  const headers = ["ds", "yhat", "yhat_lower", "yhat_upper", "trend"];
-  const rows = forecast.map((p) => [
-    p.ds,
-    Number(p.yhat ?? 0).toFixed(4),
-    Number(p.yhat_lower ?? 0).toFixed(4),
-    Number(p.yhat_upper ?? 0).toFixed(4),
-    Number(p.trend ?? 0).toFixed(4),
-  ]);
-
-  const csvString = [headers.join(","), ...rows.map((r) => r.join(","))].join(
-    "\n",
-  );
+  const csvString = forecastToCSV(forecast);
   const blob = new Blob([csvString], { type: "text/csv;charset=utf-8;" });
   const url = URL.createObjectURL(blob);
 
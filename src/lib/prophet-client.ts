@@ -13,6 +13,8 @@ interface PendingRequest<T = unknown> {
 }
 
 let workerInstance: Worker | null = null;
+let requestSeq = 0;
+let countryMapCache: Record<string, string> | null = null;
 
 // biome-ignore lint/suspicious/noExplicitAny: Worker request promises have diverse return types
 const pendingRequests = new Map<string, PendingRequest<any>>();
@@ -61,7 +63,8 @@ function getWorker(): Worker {
 }
 
 function generateRequestId(): string {
-  return `${Date.now()}_${Math.random().toString(36).substring(2, 9)}`;
+  requestSeq += 1;
+  return `req_${requestSeq}`;
 }
 
 export async function preloadProphetEngine(): Promise<void> {
@@ -102,13 +105,17 @@ export function cancelCrossValidation(requestId?: string): void {
   }
 }
 
+function getCountryMap(): Record<string, string> {
+  if (!countryMapCache) {
+    countryMapCache = new Holidays().getCountries("en");
+  }
+  return countryMapCache;
+}
+
 export async function fetchCountries(): Promise<string[]> {
-  const hd = new Holidays();
-  const countriesMap = hd.getCountries("en");
-  return Object.keys(countriesMap).sort();
+  return Object.keys(getCountryMap()).sort();
 }
 
 export async function fetchCountryMap(): Promise<Record<string, string>> {
-  const hd = new Holidays();
-  return hd.getCountries("en");
+  return getCountryMap();
 }
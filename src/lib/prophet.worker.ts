@@ -23,6 +23,13 @@ import type {
 let wasmInitPromise: Promise<unknown> | null = null;
 let cancelRequested = false;
 let activeCvRequestId: string | null = null;
+const warnedHolidayCountries = new Set<string>();
+// date-holidays occurrences keyed by `${country}:${year}`; CV refits the same
+// years for every cutoff.
+const countryHolidayCache = new Map<
+  string,
+  Array<{ name: string; start: number; end: number }>
+>();
 
 export async function ensureWasmInitialized(
   customBuffer?: ArrayBuffer | Uint8Array,
@@ -39,20 +46,25 @@ export function requestCrossValidationCancel(targetId?: string): void {
   }
 }
 
+// parseTimestamp runs once per data point, so keep its patterns compiled once
+const TZ_SUFFIX_RE = /(?:Z|[+-]\d{2}(?::?\d{2})?)$/i;
+const DATE_ONLY_RE = /^\d{4}-\d{2}-\d{2}$/;
+const DATE_TIME_SPACE_RE = /^(\d{4}-\d{2}-\d{2})\s+/;
+
 export function parseTimestamp(ds: string | number): number {
   if (typeof ds === "number") return Math.floor(ds);
   if (typeof ds !== "string") return 0;
   const str = ds.trim();
   if (!str) return 0;
 
-  const hasTz = /(?:Z|[+-]\d{2}(?::?\d{2})?)$/i.test(str);
+  const hasTz = TZ_SUFFIX_RE.test(str);
 
   let parseable = str;
   if (!hasTz) {
-    if (/^\d{4}-\d{2}-\d{2}$/.test(str)) {
+    if (DATE_ONLY_RE.test(str)) {
       parseable = `${str}T00:00:00Z`;
     } else {
-      const formatted = str.replace(/^(\d{4}-\d{2}-\d{2})\s+/, "$1T");
+      const formatted = str.replace(DATE_TIME_SPACE_RE, "$1T");
       if (formatted.includes("T")) {
         parseable = `${formatted}Z`;
       } else {
@@ -60,7 +72,7 @@ export function parseTimestamp(ds: string | number): number {
       }
     }
   } else {
-    parseable = str.replace(/^(\d{4}-\d{2}-\d{2})\s+/, "$1T");
+    parseable = str.replace(DATE_TIME_SPACE_RE, "$1T");
   }
 
   const ts = new Date(parseable).getTime();
@@ -159,6 +171,63 @@ export function parseDurationToSeconds(val: string): number {
   }
 }
 
+type FrequencyKind =
+  | "second"
+  | "minute"
+  | "hour"
+  | "day"
+  | "week"
+  | "business"
+  | "monthStart"
+  | "month"
+  | "yearStart"
+  | "year";
+
+const FREQUENCY_UNIT_KIND = new Map<string, FrequencyKind>([
+  ["S", "second"],
+  ["SEC", "second"],
+  ["SECS", "second"],
+  ["SECOND", "second"],
+  ["SECONDS", "second"],
+  ["MIN", "minute"],
+  ["MINS", "minute"],
+  ["MINUTE", "minute"],
+  ["MINUTES", "minute"],
+  ["T", "minute"],
+  ["H", "hour"],
+  ["HR", "hour"],
+  ["HRS", "hour"],
+  ["HOUR", "hour"],
+  ["HOURS", "hour"],
+  ["HOURLY", "hour"],
+  ["D", "day"],
+  ["DAY", "day"],
+  ["DAYS", "day"],
+  ["DAILY", "day"],
+  ["W", "week"],
+  ["WK", "week"],
+  ["WKS", "week"],
+  ["WEEK", "week"],
+  ["WEEKS", "week"],
+  ["WEEKLY", "week"],
+  ["B", "business"],
+  ["BUS", "business"],
+  ["BUSINESS", "business"],
+  ["MS", "monthStart"],
+  ["M", "month"],
+  ["MON", "month"],
+  ["MONTH", "month"],
+  ["MONTHS", "month"],
+  ["MONTHLY", "month"],
+  ["YS", "yearStart"],
+  ["Y", "year"],
+  ["YR", "year"],
+  ["YRS", "year"],
+  ["YEAR", "year"],
+  ["YEARS", "year"],
+  ["YEARLY", "year"],
+]);
+
 export function parseFrequencySpec(
   freqStr?: string,
 ): { quantity: number; unit: string } | null {
@@ -201,66 +270,34 @@ export function generateFutureTimestamps(
   }
 
   const { quantity, unit } = spec;
+  const kind = FREQUENCY_UNIT_KIND.get(unit);
 
-  if (
-    unit === "S" ||
-    unit === "SEC" ||
-    unit === "SECS" ||
-    unit === "SECOND" ||
-    unit === "SECONDS"
-  ) {
+  if (kind === "second") {
     const stepSec = quantity * 1;
     for (let i = 1; i <= periods; i++) {
       futureTs.push(lastTs + i * stepSec);
     }
-  } else if (
-    unit === "MIN" ||
-    unit === "MINS" ||
-    unit === "MINUTE" ||
-    unit === "MINUTES" ||
-    unit === "T"
-  ) {
+  } else if (kind === "minute") {
     const stepSec = quantity * 60;
     for (let i = 1; i <= periods; i++) {
       futureTs.push(lastTs + i * stepSec);
     }
-  } else if (
-    unit === "H" ||
-    unit === "HR" ||
-    unit === "HRS" ||
-    unit === "HOUR" ||
-    unit === "HOURS" ||
-    unit === "HOURLY"
-  ) {
+  } else if (kind === "hour") {
     const stepSec = quantity * 3600;
     for (let i = 1; i <= periods; i++) {
       futureTs.push(lastTs + i * stepSec);
     }
-  } else if (
-    unit === "D" ||
-    unit === "DAY" ||
-    unit === "DAYS" ||
-    unit === "DAILY"
-  ) {
+  } else if (kind === "day") {
+    const stepSec = quantity * 86400;
     for (let i = 1; i <= periods; i++) {
-      const d = new Date(baseDate.getTime());
-      d.setUTCDate(d.getUTCDate() + i * quantity);
-      futureTs.push(Math.floor(d.getTime() / 1000));
+      futureTs.push(Math.floor(lastTs + i * stepSec));
     }
-  } else if (
-    unit === "W" ||
-    unit === "WK" ||
-    unit === "WKS" ||
-    unit === "WEEK" ||
-    unit === "WEEKS" ||
-    unit === "WEEKLY"
-  ) {
+  } else if (kind === "week") {
+    const stepSec = quantity * 7 * 86400;
     for (let i = 1; i <= periods; i++) {
-      const d = new Date(baseDate.getTime());
-      d.setUTCDate(d.getUTCDate() + i * quantity * 7);
-      futureTs.push(Math.floor(d.getTime() / 1000));
+      futureTs.push(Math.floor(lastTs + i * stepSec));
     }
-  } else if (unit === "B" || unit === "BUS" || unit === "BUSINESS") {
+  } else if (kind === "business") {
     const curDate = new Date(baseDate.getTime());
     for (let i = 1; i <= periods; i++) {
       let added = 0;
@@ -273,7 +310,7 @@ export function generateFutureTimestamps(
       }
       futureTs.push(Math.floor(curDate.getTime() / 1000));
     }
-  } else if (unit === "MS") {
+  } else if (kind === "monthStart") {
     for (let i = 1; i <= periods; i++) {
       const targetMonthTotal = baseDate.getUTCMonth() + i * quantity;
       const targetYear =
@@ -291,13 +328,7 @@ export function generateFutureTimestamps(
       );
       futureTs.push(Math.floor(d.getTime() / 1000));
     }
-  } else if (
-    unit === "M" ||
-    unit === "MON" ||
-    unit === "MONTH" ||
-    unit === "MONTHS" ||
-    unit === "MONTHLY"
-  ) {
+  } else if (kind === "month") {
     const origDay = baseDate.getUTCDate();
     for (let i = 1; i <= periods; i++) {
       const targetMonthTotal = baseDate.getUTCMonth() + i * quantity;
@@ -320,7 +351,7 @@ export function generateFutureTimestamps(
       d.setUTCDate(Math.min(origDay, lastDayOfTargetMonth));
       futureTs.push(Math.floor(d.getTime() / 1000));
     }
-  } else if (unit === "YS") {
+  } else if (kind === "yearStart") {
     for (let i = 1; i <= periods; i++) {
       const targetYear = baseDate.getUTCFullYear() + i * quantity;
       const d = new Date(
@@ -335,14 +366,7 @@ export function generateFutureTimestamps(
       );
       futureTs.push(Math.floor(d.getTime() / 1000));
     }
-  } else if (
-    unit === "Y" ||
-    unit === "YR" ||
-    unit === "YRS" ||
-    unit === "YEAR" ||
-    unit === "YEARS" ||
-    unit === "YEARLY"
-  ) {
+  } else if (kind === "year") {
     const origMonth = baseDate.getUTCMonth();
     const origDay = baseDate.getUTCDate();
     for (let i = 1; i <= periods; i++) {
@@ -389,25 +413,8 @@ export function checkHasTimeComponents(
   if (freq) {
     const spec = parseFrequencySpec(freq);
     if (spec) {
-      const u = spec.unit;
-      if (
-        u === "S" ||
-        u === "SEC" ||
-        u === "SECS" ||
-        u === "SECOND" ||
-        u === "SECONDS" ||
-        u === "MIN" ||
-        u === "MINS" ||
-        u === "MINUTE" ||
-        u === "MINUTES" ||
-        u === "T" ||
-        u === "H" ||
-        u === "HR" ||
-        u === "HRS" ||
-        u === "HOUR" ||
-        u === "HOURS" ||
-        u === "HOURLY"
-      ) {
+      const kind = FREQUENCY_UNIT_KIND.get(spec.unit);
+      if (kind === "second" || kind === "minute" || kind === "hour") {
         return true;
       }
     }
@@ -457,7 +464,8 @@ function buildProphetOptions(
 
   if (config.country_holidays) {
     try {
-      const hd = new Holidays(config.country_holidays);
+      const country = config.country_holidays;
+      let hd: Holidays | null = null;
       const yearsSet = new Set<number>();
       for (const t of dataTimestampsSec) {
         yearsSet.add(new Date(t * 1000).getFullYear());
@@ -470,25 +478,43 @@ function buildProphetOptions(
         yearsSet.add(y);
       }
       for (const year of yearsSet) {
-        const hList = hd.getHolidays(year);
-        if (Array.isArray(hList)) {
-          for (const h of hList) {
-            if (!h.name || !h.start) continue;
-            const startSec = Math.floor(new Date(h.start).getTime() / 1000);
-            const endSec = h.end
-              ? Math.floor(new Date(h.end).getTime() / 1000)
-              : startSec + 86399;
-            const existing = holidaysMap.get(h.name) || {
-              occurrences: [],
-              priorScale: config.holidays_prior_scale ?? 10.0,
-            };
-            existing.occurrences.push({ start: startSec, end: endSec });
-            holidaysMap.set(h.name, existing);
+        const cacheKey = `${country}:${year}`;
+        let yearHolidays = countryHolidayCache.get(cacheKey);
+        if (!yearHolidays) {
+          hd ??= new Holidays(country);
+          yearHolidays = [];
+          const hList = hd.getHolidays(year);
+          if (Array.isArray(hList)) {
+            for (const h of hList) {
+              if (!h.name || !h.start) continue;
+              const startSec = Math.floor(h.start.getTime() / 1000);
+              const endSec = h.end
+                ? Math.floor(h.end.getTime() / 1000)
+                : startSec + 86399;
+              yearHolidays.push({
+                name: h.name,
+                start: startSec,
+                end: endSec,
+              });
+            }
           }
+          countryHolidayCache.set(cacheKey, yearHolidays);
+        }
+        for (const { name, start, end } of yearHolidays) {
+          const existing = holidaysMap.get(name) || {
+            occurrences: [],
+            priorScale: config.holidays_prior_scale ?? 10.0,
+          };
+          existing.occurrences.push({ start, end });
+          holidaysMap.set(name, existing);
         }
       }
     } catch (e) {
-      console.warn("Failed to load country holidays:", e);
+      // Cross-validation rebuilds options per cutoff; warn once per country.
+      if (!warnedHolidayCountries.has(config.country_holidays)) {
+        warnedHolidayCountries.add(config.country_holidays);
+        console.warn("Failed to load country holidays:", e);
+      }
     }
   }
 
@@ -533,8 +559,21 @@ function buildProphetOptions(
   return opts;
 }
 
+type ComponentSeries = ReturnType<Prophet["predict"]>["trend"];
+
+function toComponentData(ds: string[], fc: ComponentSeries): ComponentData {
+  return {
+    ds,
+    values: fc.point,
+    lower: fc.intervals?.lower,
+    upper: fc.intervals?.upper,
+  };
+}
+
+// Points may carry a pre-parsed `ts` (cross-validation slices do), in which
+// case the ds string is not parsed again.
 export function runProphetFitAndPredict(
-  dataPoints: DataPoint[],
+  dataPoints: Array<DataPoint & { ts?: number }>,
   config: ModelConfig,
   periods: number,
   freq: string,
@@ -545,8 +584,8 @@ export function runProphetFitAndPredict(
       "Insufficient data points for forecasting (at least 2 required)",
     );
   }
-  const sorted = [...dataPoints]
-    .map((d) => ({ ...d, ts: parseTimestamp(d.ds) }))
+  const sorted = dataPoints
+    .map((d) => ({ ...d, ts: d.ts ?? parseTimestamp(d.ds) }))
     .sort((a, b) => a.ts - b.ts);
   const dsSeconds = sorted.map((d) => d.ts);
   const yValues = sorted.map((d) => d.y);
@@ -555,8 +594,14 @@ export function runProphetFitAndPredict(
     ds: dsSeconds,
     y: yValues,
   };
+  let defaultCap = 0;
   if (config.growth === "logistic") {
-    trainingData.cap = sorted.map((d) => d.cap ?? Math.max(...yValues) * 1.5);
+    let maxY = Number.NEGATIVE_INFINITY;
+    for (const y of yValues) {
+      if (y > maxY) maxY = y;
+    }
+    defaultCap = maxY * 1.5;
+    trainingData.cap = sorted.map((d) => d.cap ?? defaultCap);
     trainingData.floor = sorted.map((d) => d.floor ?? 0);
   }
 
@@ -617,8 +662,7 @@ export function runProphetFitAndPredict(
     };
 
     if (config.growth === "logistic") {
-      const lastCap =
-        sorted[sorted.length - 1].cap ?? Math.max(...yValues) * 1.5;
+      const lastCap = sorted[sorted.length - 1].cap ?? defaultCap;
       const lastFloor = sorted[sorted.length - 1].floor ?? 0;
       const extraCount = allTs.length - dsSeconds.length;
       predictionData.cap = [
@@ -668,65 +712,31 @@ export function runProphetFitAndPredict(
     }
 
     const components: Record<string, ComponentData> = {
-      trend: {
-        ds: dsStrings,
-        values: predictions.trend.point,
-        lower: predictions.trend.intervals?.lower,
-        upper: predictions.trend.intervals?.upper,
-      },
+      trend: toComponentData(dsStrings, predictions.trend),
     };
 
     if (predictions.additive && predictions.additive.point.length > 0) {
-      components.additive = {
-        ds: dsStrings,
-        values: predictions.additive.point,
-        lower: predictions.additive.intervals?.lower,
-        upper: predictions.additive.intervals?.upper,
-      };
+      components.additive = toComponentData(dsStrings, predictions.additive);
     }
 
     if (
       predictions.multiplicative &&
       predictions.multiplicative.point.length > 0
     ) {
-      components.multiplicative = {
-        ds: dsStrings,
-        values: predictions.multiplicative.point,
-        lower: predictions.multiplicative.intervals?.lower,
-        upper: predictions.multiplicative.intervals?.upper,
-      };
-    }
-
-    if (predictions.seasonalities) {
-      for (const [name, fc] of predictions.seasonalities.entries()) {
-        components[name] = {
-          ds: dsStrings,
-          values: fc.point,
-          lower: fc.intervals?.lower,
-          upper: fc.intervals?.upper,
-        };
-      }
-    }
-
-    if (predictions.holidays) {
-      for (const [name, fc] of predictions.holidays.entries()) {
-        components[name] = {
-          ds: dsStrings,
-          values: fc.point,
-          lower: fc.intervals?.lower,
-          upper: fc.intervals?.upper,
-        };
-      }
+      components.multiplicative = toComponentData(
+        dsStrings,
+        predictions.multiplicative,
+      );
     }
 
-    if (predictions.regressors) {
-      for (const [name, fc] of predictions.regressors.entries()) {
-        components[name] = {
-          ds: dsStrings,
-          values: fc.point,
-          lower: fc.intervals?.lower,
-          upper: fc.intervals?.upper,
-        };
+    for (const group of [
+      predictions.seasonalities,
+      predictions.holidays,
+      predictions.regressors,
+    ]) {
+      if (!group) continue;
+      for (const [name, fc] of group.entries()) {
+        components[name] = toComponentData(dsStrings, fc);
       }
     }
 
@@ -780,6 +790,28 @@ interface EvaluatedPoint {
   isCovered: boolean;
 }
 
+// Cutoffs step back from maxTs - horizon by period while at least `initial`
+// of history remains, returned in ascending order.
+export function computeCutoffs(
+  minTs: number,
+  maxTs: number,
+  initialSec: number,
+  periodSec: number,
+  horizonSec: number,
+): number[] {
+  const minCutoff = minTs + initialSec;
+  const lastCutoff = maxTs - horizonSec;
+  if (lastCutoff < minCutoff) return [];
+  if (periodSec <= 0) return [lastCutoff];
+
+  const count = Math.floor((lastCutoff - minCutoff) / periodSec) + 1;
+  const cutoffs = new Array<number>(count);
+  for (let k = 0; k < count; k++) {
+    cutoffs[k] = lastCutoff - (count - 1 - k) * periodSec;
+  }
+  return cutoffs;
+}
+
 export async function runCrossValidation(
   request: CrossValidationRequest,
   id: string,
@@ -803,17 +835,13 @@ export async function runCrossValidation(
     const periodSec = parseDurationToSeconds(period);
     const horizonSec = parseDurationToSeconds(horizon);
 
-    const minCutoff = minTs + initialSec;
-    const cutoffs: number[] = [];
-    let curCutoff = maxTs - horizonSec;
-
-    while (curCutoff >= minCutoff) {
-      cutoffs.push(curCutoff);
-      curCutoff -= periodSec;
-    }
-
-    cutoffs.reverse();
-
+    const cutoffs = computeCutoffs(
+      minTs,
+      maxTs,
+      initialSec,
+      periodSec,
+      horizonSec,
+    );
     if (cutoffs.length === 0) {
       throw new Error(
         `Data timespan is too short for requested initial (${initial}), horizon (${horizon})`,
@@ -829,6 +857,7 @@ export async function runCrossValidation(
       freq,
     );
 
+    let lastPostedPercent = -1;
     for (let k = 0; k < cutoffs.length; k++) {
       await new Promise((resolve) => setTimeout(resolve, 0));
       if (cancelRequested && (!activeCvRequestId || activeCvRequestId === id)) {
@@ -841,7 +870,10 @@ export async function runCrossValidation(
       const cutoff = cutoffs[k];
       const cutoffIso = formatIsoDate(cutoff, hasTime);
       const percent = Math.round(((k + 1) / cutoffs.length) * 100);
-      if (typeof self !== "undefined") {
+      // Long sub-daily runs can have hundreds of cutoffs; only post (and
+      // re-render the overlay) when the visible percentage actually moves.
+      if (typeof self !== "undefined" && percent !== lastPostedPercent) {
+        lastPostedPercent = percent;
         self.postMessage({
           type: "CV_PROGRESS",
           id,
@@ -926,42 +958,61 @@ export async function runCrossValidation(
     // Sort evaluation points by horizon length
     evalPoints.sort((a, b) => a.horizonSec - b.horizonSec);
 
-    // Group evaluation points into horizon bins matching Prophet's performance_metrics
-    const uniqueHorizons = Array.from(
-      new Set(evalPoints.map((p) => p.horizonSec)),
-    ).sort((a, b) => a - b);
+    // Group evaluation points into horizon bins matching Prophet's
+    // performance_metrics. evalPoints is sorted by horizon, so every bin is a
+    // contiguous run and both branches fill their bins in a single pass.
+    let uniqueHorizonCount = 0;
+    for (let i = 0; i < evalPoints.length; i++) {
+      if (
+        i === 0 ||
+        evalPoints[i].horizonSec !== evalPoints[i - 1].horizonSec
+      ) {
+        uniqueHorizonCount++;
+      }
+    }
+
+    const formatHorizonLabel = (hSec: number) =>
+      hasTime
+        ? `${Math.max(1, Math.round(hSec / 3600))} hours`
+        : `${Math.max(1, Math.round(hSec / 86400))} days`;
 
     const horizonBins: Array<{ label: string; points: EvaluatedPoint[] }> = [];
+    let binPoints: EvaluatedPoint[] = [];
+    const closeBin = () => {
+      if (binPoints.length === 0) return;
+      const maxBinH = binPoints[binPoints.length - 1].horizonSec;
+      horizonBins.push({
+        label: formatHorizonLabel(maxBinH),
+        points: binPoints,
+      });
+      binPoints = [];
+    };
 
-    if (uniqueHorizons.length <= 12) {
-      for (const hSec of uniqueHorizons) {
-        const pts = evalPoints.filter((p) => p.horizonSec === hSec);
-        const label = hasTime
-          ? `${Math.max(1, Math.round(hSec / 3600))} hours`
-          : `${Math.max(1, Math.round(hSec / 86400))} days`;
-        horizonBins.push({ label, points: pts });
+    if (uniqueHorizonCount <= 12) {
+      for (const p of evalPoints) {
+        if (binPoints.length > 0 && p.horizonSec !== binPoints[0].horizonSec) {
+          closeBin();
+        }
+        binPoints.push(p);
       }
     } else {
       const numBins = 10;
-      const minH = uniqueHorizons[0];
-      const maxH = uniqueHorizons[uniqueHorizons.length - 1];
+      const minH = evalPoints[0].horizonSec;
+      const maxH = evalPoints[evalPoints.length - 1].horizonSec;
       const binWidth = (maxH - minH) / numBins;
 
-      for (let b = 0; b < numBins; b++) {
-        const binStart = minH + b * binWidth;
-        const binEnd = b === numBins - 1 ? maxH + 1 : minH + (b + 1) * binWidth;
-        const pts = evalPoints.filter(
-          (p) => p.horizonSec >= binStart && p.horizonSec < binEnd,
-        );
-        if (pts.length === 0) continue;
-
-        const maxBinH = Math.max(...pts.map((p) => p.horizonSec));
-        const label = hasTime
-          ? `${Math.max(1, Math.round(maxBinH / 3600))} hours`
-          : `${Math.max(1, Math.round(maxBinH / 86400))} days`;
-        horizonBins.push({ label, points: pts });
+      let b = 0;
+      let binEnd = minH + binWidth;
+      for (const p of evalPoints) {
+        while (b < numBins - 1 && p.horizonSec >= binEnd) {
+          closeBin();
+          b++;
+          binEnd = b === numBins - 1 ? maxH + 1 : minH + (b + 1) * binWidth;
+        }
+        binPoints.push(p);
       }
     }
+    closeBin();
 
     const horizonLabels: string[] = [];
     const mseList: number[] = [];